@@ -19,11 +19,15 @@ Relative paths, absolute Windows paths, and `.fplite` items all still work.
 
 from __future__ import annotations
 
+import functools
+import ntpath
 import os
+import re
 import shutil
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from pathlib import PureWindowsPath
 from urllib.parse import unquote           # ← NEW
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
@@ -31,37 +35,198 @@ from typing import Dict, Iterable, List, Set, Tuple
 
 PATTERN_DEPTH = 2
 PLAYLIST_EXTS = {".m3u", ".m3u8", ".fplite"}
+_PL_EXT_NODOT = {e[1:] for e in PLAYLIST_EXTS}   # set lookup, no splitext
 URI_PREFIXES  = ("file:///", "file://", "file:\\\\", "file:\\")  # longest first
+# alternation mirrors URI_PREFIXES order: longest first wins
+_PREFIX_RE = re.compile(r"(?i)(file:///|file://|file:\\\\|file:\\)")
+# a drive spec anywhere in a file: letter+colon+separator, not preceded
+# by another letter (so 'EXTINF:' and the like don't match)
+_DRIVE_RE  = re.compile(r"(?<![A-Za-z])([A-Za-z]:)[\\/]")
+# blank or comment line (optionally BOM/whitespace-led) — one match
+# replaces the lstrip/rstrip/startswith dance in the skip path
+_SKIP_RE   = re.compile("\ufeff?\\s*(?:#|$)")
+# real line breaks only \u2014 str.splitlines would also split on NEL/FF/LS
+# etc., which the latin-1 fallback can produce inside a title
+_LINEBREAK_RE = re.compile(r"\r\n|\r|\n")
 
 
 # ─────────────────────── helpers ────────────────────────────────────
+def _iter_playlist_files(root: str, recursive: bool) -> Iterable[str]:
+    """Yield playlist paths under *root* using os.scandir.
+
+    DirEntry already carries the file-type info from readdir, so no extra
+    stat per entry; the extension check runs first to short-circuit.
+    """
+    pending = deque([root])
+    while pending:
+        folder = pending.popleft()
+        try:
+            entries = os.scandir(folder)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                # directories first: one named e.g. 'sub.m3u' must still
+                # recurse, not be mistaken for a playlist
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+                _stem, sep, ext = entry.name.rpartition(".")
+                if sep and ext.lower() in _PL_EXT_NODOT:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            yield entry.path
+                    except OSError:
+                        pass
+
+
 def _strip_prefix(line: str) -> Tuple[str, str]:
     """Return (uri_prefix, remainder)."""
-    lower = line.lower()
-    for pre in URI_PREFIXES:
-        if lower.startswith(pre):
-            return line[: len(pre)], line[len(pre):]
+    # typical lines start with a drive letter or backslash — rule the
+    # common no-prefix case out on the first character before the regex
+    if not line or line[0] not in "fF":
+        return "", line
+    m = _PREFIX_RE.match(line)
+    if m:
+        return line[: m.end()], line[m.end():]
     return "", line
 
 
-def _parse_path_line(line: str) -> Tuple[str, PureWindowsPath] | None:
+@functools.lru_cache(maxsize=200_000)
+def _parse_path_line(line: str) -> Tuple[str, str, Tuple[str, ...]] | None:
     """
-    Return (uri_prefix, PureWindowsPath) or None for blank/comment lines.
+    Return (uri_prefix, drive, folder_parts) or None for blank/comment lines.
     Percent-decoding added so %20 etc. are handled.
+
+    Plain strings and tuples throughout — no PureWindowsPath allocation
+    per line.  Cached: the same lines are re-parsed by _load, _save and
+    the mass-change passes, and prefixes repeat across playlists.
     """
-    raw = line.lstrip("\ufeff")            # drop UTF-8 BOM if present
-    stripped = raw.rstrip("\r\n")
-    if not stripped or stripped.lstrip().startswith("#"):
+    if _SKIP_RE.match(line):               # blank/comment \u2014 one regex test
         return None
+    stripped = line.lstrip("\ufeff").rstrip("\r\n")
     prefix, rest = _strip_prefix(stripped)
-    rest = unquote(rest)                   # ← percent-decode
-    rest = rest.replace("/", "\\")
-    return prefix, PureWindowsPath(rest)
+    if "%" in rest:                        # ← percent-decode only if needed
+        rest = unquote(rest)
+    if "/" in rest:                        # normalize separators only if needed
+        rest = rest.replace("/", "\\")
+    drive, tail = ntpath.splitdrive(rest)  # 'D:', '\\\\server\\share' or ''
+    if tail.startswith("\\"):
+        drive += "\\"                      # keep the root anchor ('D:\\', '\\')
+    # intern components: directory names repeat across thousands of
+    # lines/files, so share one string object per distinct name
+    # (pathlib does the same in its flavour parser)
+    parts = tuple(sys.intern(x) for x in tail.split("\\") if x)
+    return prefix, sys.intern(drive), parts
+
+
+@functools.lru_cache(maxsize=50_000)
+def _root_of(drive: str, parts: Tuple[str, ...],
+             depth: int = PATTERN_DEPTH) -> Tuple[str, ...]:
+    """drive + the first <depth> folders → root pattern (cached)."""
+    return (drive,) + parts[:depth] if drive else parts[: depth + 1]
+
+
+def _is_skippable(line: str) -> bool:
+    """Cheap single-char pre-test for blank/comment lines.
+
+    Lines come from _read_playlist ending-less and BOM-less, so a first
+    char of '#' (or an empty line) means the full parser would bail
+    anyway; anything else falls through to _parse_path_line.
+    """
+    return not line or line[0] == "#"
+
 
+def _join_parts(parts: Tuple[str, ...]) -> str:
+    """Reassemble an (anchor, folders…) tuple into a backslash path string.
+
+    An anchored first element already carries its separator ('D:\\',
+    '\\') or marks a drive-relative path ('D:'), so nothing is inserted
+    after it — mirroring how PureWindowsPath renders each case.
+    """
+    if parts and parts[0][-1:] in ("\\", ":"):
+        return parts[0] + "\\".join(parts[1:])
+    return "\\".join(parts)
 
-def _root_of(p: PureWindowsPath, depth: int = PATTERN_DEPTH) -> PureWindowsPath:
-    """drive + the first <depth> folders → root pattern."""
-    return PureWindowsPath(*p.parts[: depth + 1]) if p.parts else p
+
+def _compile_rewriter(rewrites: List[Tuple[str, str, str, int]]):
+    """exec-compile a path rewriter specialized to one save's mapping.
+
+    The mapping is fixed for the whole save, so inline it as a chain of
+    startswith branches — no per-line loop over the rewrite list.
+    Branch order is longest root first (a shorter root may prefix a
+    longer one), then most-populated group first for early exit.
+    """
+    src = ["def _xform(path):"]
+    for old, old_pref, new, _freq in rewrites:
+        src.append(f"    if path.startswith({old_pref!r}) or path == {old!r}:")
+        src.append(f"        return {new!r} + path[{len(old)}:]")
+    src.append("    return None")
+    ns: Dict[str, object] = {}
+    exec("\n".join(src), ns)               # source is self-generated above
+    return ns["_xform"]
+
+
+def _backup(path: str, bak_dir: str) -> None:
+    """Put a copy of *path* in *bak_dir*.
+
+    A hard link is O(1) regardless of file size and works on the common
+    same-volume case; across volumes (or on filesystems without link
+    support) fall back to a real copy.
+    """
+    bak = os.path.join(bak_dir, os.path.basename(path))
+    try:
+        if os.path.exists(bak):
+            os.remove(bak)             # replace a stale backup
+        os.link(path, bak)
+    except OSError:
+        # copyfile, not copy2: a just-in-case backup doesn't need the
+        # extra stat metadata syscalls
+        shutil.copyfile(path, bak)
+
+
+def _pool_size() -> int:
+    """Worker count for per-playlist I/O — file reads release the GIL."""
+    return min(32, (os.cpu_count() or 4) * 4)
+
+
+def _read_playlist(path: str) -> Tuple[List[str], str]:
+    """Read *path* in one shot → (lines_without_endings, line_ending).
+
+    One read syscall, BOM stripped by slicing, UTF-8 decode with a
+    latin-1 fallback from the same buffer, and the dominant line ending
+    detected once per file instead of per line during reassembly.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if data.startswith(b"\xef\xbb\xbf"):
+        data = data[3:]
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("latin-1")
+    crlf = text.count("\r\n")
+    le = "\r\n" if crlf and crlf * 2 >= text.count("\n") else "\n"
+    lines = _LINEBREAK_RE.split(text)
+    if lines and lines[-1] == "":
+        lines.pop()                        # slot after a trailing newline
+    return lines, le
+
+
+def _write_text(path: str, text: str) -> None:
+    """Write *text* in one call via a temp file + atomic replace.
+
+    One write instead of one per line, and os.replace means a crash
+    mid-write can't truncate the original.
+    """
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    os.replace(tmp, path)
 
 
 # ───────────────────── Tooltip helper ───────────────────────────────
@@ -71,43 +236,58 @@ class ListboxTooltip:
     def __init__(self, listbox: tk.Listbox, get_text_for_index):
         self.lb = listbox
         self.get_text = get_text_for_index
-        self._tip: tk.Toplevel | None = None
+        # one reusable tip window: withdraw/deiconify instead of
+        # destroying and rebuilding it on every hover
+        self._tip = tk.Toplevel(self.lb)
+        self._tip.wm_overrideredirect(True)
+        self._tip.attributes("-topmost", True)
+        self._tip.withdraw()
+        self._lbl = ttk.Label(self._tip, background="#ffffe0",
+                              relief="solid", borderwidth=1,
+                              font=("TkDefaultFont", 9), justify="left")
+        self._lbl.pack(ipadx=4, ipady=2)
+        self._last_idx = -1
+        self._pending: str | None = None
         self.lb.bind("<Motion>", self._motion)
         self.lb.bind("<Leave>", lambda _e: self._hide())
 
     def _motion(self, event):
-        idx = self.lb.nearest(event.y)
+        # Tk fires <Motion> per pixel; coalesce to ~33 Hz
+        if self._pending is not None:
+            self.lb.after_cancel(self._pending)
+        self._pending = self.lb.after(30, self._do_motion, event.x_root,
+                                      event.y_root, self.lb.nearest(event.y))
+
+    def _do_motion(self, x_root: int, y_root: int, idx: int):
+        self._pending = None
         if idx < 0 or idx >= self.lb.size():
             self._hide(); return
-        text = self.get_text(idx)
-        if not text:
-            self._hide(); return
-        if self._tip is None:
-            self._tip = tk.Toplevel(self.lb)
-            self._tip.wm_overrideredirect(True)
-            self._tip.attributes("-topmost", True)
-            lbl = ttk.Label(self._tip, text=text, background="#ffffe0",
-                            relief="solid", borderwidth=1,
-                            font=("TkDefaultFont", 9), justify="left")
-            lbl.pack(ipadx=4, ipady=2)
-        else:
-            self._tip.winfo_children()[0].configure(text=text)
-        self._tip.wm_geometry(f"+{event.x_root+20}+{event.y_root+10}")
+        if idx != self._last_idx:
+            text = self.get_text(idx)
+            if not text:
+                self._hide(); return
+            self._lbl.configure(text=text)
+            self._last_idx = idx
+            self._tip.deiconify()
+        self._tip.wm_geometry(f"+{x_root+20}+{y_root+10}")
 
     def _hide(self):
-        if self._tip:
-            self._tip.destroy()
-        self._tip = None
+        if self._pending is not None:
+            self.lb.after_cancel(self._pending)
+            self._pending = None
+        self._tip.withdraw()
+        self._last_idx = -1
 
 
 # ─────────────────────── GUI app ────────────────────────────────────
 @dataclass
 class GroupUI:
-    old_root: PureWindowsPath
+    old_root: Tuple[str, ...]
     var: tk.StringVar
     example_var: tk.StringVar
-    sample_pw: PureWindowsPath
+    sample_parts: Tuple[str, ...]          # full (drive, folders…) tuple
     sample_prefix: str
+    pending: str | None = None             # after() id of a queued recompute
 
 
 class PlaylistFixer(tk.Tk):
@@ -157,7 +337,7 @@ class PlaylistFixer(tk.Tk):
         self._idx2path: Dict[int, str] = {}
         ListboxTooltip(self.listbox, lambda i: self._idx2path.get(i,""))
 
-        # ── Mapping area
+        # ── Mapping area (virtualized: rows materialize on scroll)
         self.fr_map = ttk.LabelFrame(self, text="3 • Adjust each root then save")
         self.fr_map.pack(fill="both", expand=False, padx=10, pady=4)
 
@@ -166,11 +346,30 @@ class PlaylistFixer(tk.Tk):
                                    command=self._save, state="disabled")
         self.btn_save.pack(side="bottom", pady=8)
 
+        self.map_canvas = tk.Canvas(self.fr_map, height=240,
+                                    highlightthickness=0)
+        self._map_sb = ttk.Scrollbar(self.fr_map, orient="vertical",
+                                     command=self.map_canvas.yview)
+        self._map_sb.pack(side="right", fill="y")
+        self.map_canvas.pack(fill="both", expand=True, padx=(8,0), pady=2)
+        self.map_canvas.configure(yscrollcommand=self._on_map_scroll)
+        self.map_canvas.bind("<Configure>",
+                             lambda _e: self._render_map_rows())
+        self.map_canvas.bind("<MouseWheel>",
+                             lambda e: self.map_canvas.yview_scroll(
+                                 -e.delta // 120, "units"))
+        self._row_h = 44                       # fixed row height in px
+        self._made_rows: Set[int] = set()
+
         # internal state
         self._all_playlists: List[str] = []
+        self._hl_idx: int | None = None
+        # playlist path → (text, drive_letters, line_ending)
+        self._playlist_cache: Dict[str, Tuple[str, Set[str], str]] = {}
         self._loaded_path: str | None = None
         self._orig_lines: List[str] = []
-        self._groups: Dict[PureWindowsPath, List[str]] = {}
+        self._le: str = "\n"
+        self._groups: Dict[Tuple[str, ...], List[str]] = {}
         self._group_widgets: List[GroupUI] = []
 
     # ── scan helpers -------------------------------------------------
@@ -184,23 +383,16 @@ class PlaylistFixer(tk.Tk):
         if not os.path.exists(root):
             messagebox.showerror("Invalid path", "Folder doesn’t exist."); return
         self.listbox.delete(0, tk.END); self._idx2path.clear()
-        self._all_playlists.clear()
-
-        iterable: Iterable[str]
-        if self.recursive.get():
-            iterable = (os.path.join(dp, f)
-                        for dp, _d, files in os.walk(root) for f in files)
-        else:
-            iterable = (os.path.join(root, f) for f in os.listdir(root)
-                        if os.path.isfile(os.path.join(root,f)))
+        self._all_playlists.clear(); self._hl_idx = None
+        self._playlist_cache.clear()
+        _parse_path_line.cache_clear(); _root_of.cache_clear()
 
-        for p in iterable:
-            if os.path.splitext(p)[1].lower() in PLAYLIST_EXTS:
-                idx = self.listbox.size()
-                self.listbox.insert(tk.END, os.path.basename(p))
-                self._idx2path[idx] = p
-                self.listbox.itemconfig(idx, bg="white")
-                self._all_playlists.append(p)
+        self._all_playlists.extend(_iter_playlist_files(root,
+                                                        self.recursive.get()))
+        self._idx2path.update(enumerate(self._all_playlists))
+        # one Tcl call instead of one insert round-trip per row
+        self.listbox.insert(tk.END,
+                            *(os.path.basename(p) for p in self._all_playlists))
 
         if not self.listbox.size():
             messagebox.showinfo("Nothing found", "No playlists in location.")
@@ -212,62 +404,97 @@ class PlaylistFixer(tk.Tk):
         idx = self.listbox.curselection()[0]
         self._loaded_path = self._idx2path[idx]
 
-        # highlight row
-        for i in range(self.listbox.size()):
-            self.listbox.itemconfig(i, bg="white")
+        # highlight row (reset only the previous one — O(1), not O(N))
+        if self._hl_idx is not None and self._hl_idx < self.listbox.size():
+            self.listbox.itemconfig(self._hl_idx, bg="white")
         self.listbox.itemconfig(idx, bg=self.HILITE)
+        self._hl_idx = idx
 
         # read lines
-        try:
-            with open(self._loaded_path, "r", encoding="utf-8-sig") as f:
-                self._orig_lines = f.readlines()
-        except UnicodeDecodeError:
-            with open(self._loaded_path, "r", encoding="latin-1") as f:
-                self._orig_lines = f.readlines()
+        self._orig_lines, self._le = _read_playlist(self._loaded_path)
 
         # group by root pattern
-        self._groups.clear(); samples: Dict[PureWindowsPath,Tuple[str,PureWindowsPath]]={}
+        self._groups.clear(); samples: Dict[Tuple[str,...],Tuple[str,Tuple[str,...]]]={}
         for ln in self._orig_lines:
             parsed = _parse_path_line(ln)
             if parsed:
-                prefix, pw = parsed
-                root = _root_of(pw)
+                prefix, drive, parts = parsed
+                root = _root_of(drive, parts)
+                full = (drive,) + parts if drive else parts
                 self._groups.setdefault(root, []).append(ln)
-                samples.setdefault(root, (prefix, pw))
+                samples.setdefault(root, (prefix, full))
 
-        # build UI
-        for w in self.fr_map.winfo_children():
-            if w not in {self.btn_save}: w.destroy()
+        # build group state; widgets are created on demand while scrolling
+        for w in self.map_canvas.winfo_children():
+            w.destroy()
+        self.map_canvas.delete("all")
+        self._made_rows.clear()
         self._group_widgets.clear()
 
-        for root in sorted(self._groups, key=str):
-            row = ttk.Frame(self.fr_map); row.pack(fill="x", padx=8, pady=2)
-            ttk.Label(row, text=str(root), width=46, anchor="w").pack(side="left")
-
-            var = tk.StringVar(value=str(root))
-            ttk.Entry(row, textvariable=var).pack(side="left", fill="x", expand=True)
-
+        for root in sorted(self._groups, key=_join_parts):
+            var = tk.StringVar(value=_join_parts(root))
             ex_var = tk.StringVar()
-            ttk.Label(row, textvariable=ex_var, anchor="w", justify="left",
-                      foreground="#558").pack(side="left", padx=(6,0))
-
-            prefix, sample_pw = samples[root]
-            gui = GroupUI(root, var, ex_var, sample_pw, prefix)
+            prefix, sample_parts = samples[root]
+            gui = GroupUI(root, var, ex_var, sample_parts, prefix)
             self._group_widgets.append(gui)
-            self._update_example(gui)
+            self._do_update_example(gui)   # immediate — no debounce at load
             var.trace_add("write",
                           lambda *_a, g=gui: self._update_example(g))
 
+        self.map_canvas.configure(
+            scrollregion=(0, 0, 0, len(self._group_widgets) * self._row_h))
+        self.map_canvas.yview_moveto(0)
+        self._render_map_rows()
+
         self.btn_save.config(state="normal")
 
+    def _on_map_scroll(self, first: str, last: str):
+        self._map_sb.set(first, last)
+        self._render_map_rows()
+
+    def _make_map_row(self, idx: int):
+        g = self._group_widgets[idx]
+        row = ttk.Frame(self.map_canvas)
+        ttk.Label(row, text=_join_parts(g.old_root), width=46,
+                  anchor="w").pack(side="left")
+        ttk.Entry(row, textvariable=g.var).pack(side="left", fill="x",
+                                                expand=True)
+        ttk.Label(row, textvariable=g.example_var, anchor="w", justify="left",
+                  foreground="#558").pack(side="left", padx=(6,0))
+        self.map_canvas.create_window(
+            0, idx * self._row_h, anchor="nw", window=row,
+            width=max(self.map_canvas.winfo_width(), 400))
+        self._made_rows.add(idx)
+
+    def _render_map_rows(self):
+        """Materialize only the rows intersecting the visible viewport."""
+        if not self._group_widgets:
+            return
+        top = self.map_canvas.canvasy(0)
+        height = self.map_canvas.winfo_height()
+        first = max(0, int(top // self._row_h) - 2)
+        last = min(len(self._group_widgets),
+                   int((top + height) // self._row_h) + 3)
+        for idx in range(first, last):
+            if idx not in self._made_rows:
+                self._make_map_row(idx)
+        width = max(self.map_canvas.winfo_width(), 400)
+        for item in self.map_canvas.find_all():
+            self.map_canvas.itemconfigure(item, width=width)
+
     def _update_example(self, g: GroupUI):
-        new_root = PureWindowsPath(g.var.get().replace("/", "\\"))
-        try: tail = g.sample_pw.relative_to(g.old_root)
-        except ValueError:
-            tail = PureWindowsPath(*g.sample_pw.parts[len(g.old_root.parts):])
-        new_pw = new_root / tail
-        before = f"{g.sample_prefix}{g.sample_pw}"
-        after  = f"{g.sample_prefix}{new_pw}"
+        # debounce: coalesce per-keystroke traces into one recompute
+        if g.pending is not None:
+            self.after_cancel(g.pending)
+        g.pending = self.after(80, self._do_update_example, g)
+
+    def _do_update_example(self, g: GroupUI):
+        g.pending = None
+        new_root = g.var.get().replace("/", "\\").rstrip("\\")
+        tail = g.sample_parts[len(g.old_root):]
+        new_path = "\\".join((new_root,) + tail) if new_root else _join_parts(tail)
+        before = f"{g.sample_prefix}{_join_parts(g.sample_parts)}"
+        after  = f"{g.sample_prefix}{new_path}"
         g.example_var.set(f"{before}\n→ {after}")
 
     # ── save playlist ------------------------------------------------
@@ -275,51 +502,68 @@ class PlaylistFixer(tk.Tk):
         if not self._loaded_path: return
         bak_dir = os.path.join(os.path.dirname(self._loaded_path), "backup")
         os.makedirs(bak_dir, exist_ok=True)
-        shutil.copy2(self._loaded_path,
-                     os.path.join(bak_dir, os.path.basename(self._loaded_path)))
-
-        mapping = {g.old_root: PureWindowsPath(g.var.get().replace("/", "\\"))
-                   for g in self._group_widgets}
-
-        updated: List[str] = []
-        for ln in self._orig_lines:
-            parsed = _parse_path_line(ln)
-            if not parsed:
-                updated.append(ln); continue
-            prefix, pw = parsed
-            old_root = _root_of(pw)
-            new_root = mapping.get(old_root, old_root)
-            if new_root != old_root:
-                try: tail = pw.relative_to(old_root)
-                except ValueError:
-                    tail = PureWindowsPath(*pw.parts[len(old_root.parts):])
-                new_pw = new_root / tail
-                le = "\n" if ln.endswith("\n") else "\r\n"
-                ln = prefix + str(new_pw) + le
-            updated.append(ln)
+        _backup(self._loaded_path, bak_dir)
+
+        # (old_root, old_root + "\\", new_root, group_size)
+        rewrites: List[Tuple[str, str, str, int]] = []
+        for g in self._group_widgets:
+            old = sys.intern(_join_parts(g.old_root))
+            new = sys.intern(g.var.get().replace("/", "\\").rstrip("\\"))
+            if new and new != old:
+                rewrites.append((old, old + "\\", new,
+                                 len(self._groups[g.old_root])))
+        rewrites.sort(key=lambda r: (-len(r[0]), -r[3]))
+        if not rewrites:
+            # every root left unchanged — re-emit the original lines
+            updated = self._orig_lines
+        else:
+            xform = _compile_rewriter(rewrites)
+            updated = []
+            for ln in self._orig_lines:
+                if _is_skippable(ln):
+                    updated.append(ln); continue
+                parsed = _parse_path_line(ln)
+                if not parsed:
+                    updated.append(ln); continue
+                prefix, drive, parts = parsed
+                path_str = _join_parts((drive,) + parts if drive else parts)
+                new_path = xform(path_str)
+                if new_path is not None:
+                    ln = prefix + new_path
+                updated.append(ln)
 
         try:
-            with open(self._loaded_path,"w",encoding="utf-8") as f:
-                f.writelines(updated)
+            _write_text(self._loaded_path,
+                        self._le.join(updated) + self._le)
+            self._playlist_cache.pop(self._loaded_path, None)
             messagebox.showinfo("Saved", f"Playlist updated.\nBackup in: {bak_dir}")
         except Exception as exc:                                   # noqa: BLE001
             messagebox.showerror("Write failed", str(exc))
 
     # ── mass-change drive letters -----------------------------------
+    def _get_parsed(self, path: str) -> Tuple[str, Set[str], str]:
+        """Memoized (text, drive_letters, line_ending) for one playlist."""
+        cached = self._playlist_cache.get(path)
+        if cached is None:
+            lines, le = _read_playlist(path)
+            text = le.join(lines)
+            # one regex scan for discovery — no per-line parsing
+            drvs = {d.upper() for d in _DRIVE_RE.findall(text)}
+            cached = self._playlist_cache[path] = (text, drvs, le)
+        return cached
+
+    def _drives_in(self, path: str) -> Set[str]:
+        """Drive letters referenced by one playlist (thread-safe)."""
+        return self._get_parsed(path)[1]
+
     def _mass_change(self):
         if not self._all_playlists:
             messagebox.showinfo("Nothing scanned", "Scan first."); return
 
-        drives: Set[str] = set()
-        for pl in self._all_playlists:
-            try:
-                with open(pl,"r",encoding="utf-8-sig") as f: lines=f.readlines()
-            except UnicodeDecodeError:
-                with open(pl,"r",encoding="latin-1") as f: lines=f.readlines()
-            for ln in lines:
-                parsed = _parse_path_line(ln)
-                if parsed and parsed[1].drive:
-                    drives.add(parsed[1].drive)      # e.g. 'D:'
+        # per-file parsing is I/O-bound and independent → thread pool
+        with ThreadPoolExecutor(max_workers=_pool_size()) as pool:
+            drives = set().union(*pool.map(self._drives_in,
+                                           self._all_playlists))
 
         if not drives:
             messagebox.showinfo("No drives","No drive letters detected."); return
@@ -337,9 +581,11 @@ class PlaylistFixer(tk.Tk):
             vars[drv] = var
 
         def apply():
-            mapping = {old: v.get().strip().upper() + ":"
-                       for old, v in vars.items()
-                       if v.get().strip() and (v.get().strip().upper()+":") != old}
+            mapping: Dict[str, str] = {}
+            for old, v in vars.items():    # one .get() per row, not three
+                new = v.get().strip().upper()
+                if new and new + ":" != old:
+                    mapping[old] = new + ":"
             if not mapping: win.destroy(); return
             updated = self._apply_drive_changes(mapping)
             messagebox.showinfo("Done",
@@ -349,41 +595,49 @@ class PlaylistFixer(tk.Tk):
         ttk.Button(win, text="Apply to all playlists",
                    command=apply).pack(pady=10)
 
-    def _apply_drive_changes(self, mapping: Dict[str,str]) -> int:
-        changed_files = 0
-        for pl in self._all_playlists:
-            try:
-                with open(pl,"r",encoding="utf-8-sig") as f: lines=f.readlines()
-            except UnicodeDecodeError:
-                with open(pl,"r",encoding="latin-1") as f: lines=f.readlines()
-
-            updated: List[str] = []; changed=False
-            for ln in lines:
-                parsed = _parse_path_line(ln)
-                if not parsed:
-                    updated.append(ln); continue
-                prefix, pw = parsed
-                drv = pw.drive
-                if drv in mapping:
-                    new_drv = mapping[drv]
-                    tail = PureWindowsPath(*pw.parts[1:])
-                    new_pw = PureWindowsPath(new_drv + "\\") / tail
-                    le = "\n" if ln.endswith("\n") else "\r\n"
-                    ln = prefix + str(new_pw) + le; changed=True
-                updated.append(ln)
+    def _rewrite_file(self, pl: str, mapping: Dict[str, str],
+                      pattern: re.Pattern[str],
+                      made_dirs: Set[str]) -> bool:
+        """Rewrite one playlist's drive letters; True if the file changed."""
+        text, drvs, le = self._get_parsed(pl)
+        if not drvs & mapping.keys():
+            return False
+
+        def repl(m: re.Match[str]) -> str:
+            return m.group(1) + mapping[m.group(2).upper()] + m.group(3)
+
+        # one C-level pass over the whole file instead of a Python loop
+        new_text, n = pattern.subn(repl, text)
+        if not n:
+            return False
+        bak_dir = os.path.join(os.path.dirname(pl), "backup")
+        if bak_dir not in made_dirs:       # one mkdir per directory, not per file
+            os.makedirs(bak_dir, exist_ok=True)
+            made_dirs.add(bak_dir)
+        _backup(pl, bak_dir)
+        try:
+            _write_text(pl, new_text + le)
+            new_drvs = {mapping.get(d, d) for d in drvs}
+            self._playlist_cache[pl] = (new_text, new_drvs, le)
+            return True
+        except Exception:                                 # noqa: BLE001
+            # worker thread → marshal the warning back to the Tk thread
+            self.after(0, messagebox.showwarning, "Write failed",
+                       f"Couldn’t update {pl}.")
+            return False
 
-            if changed:
-                bak_dir = os.path.join(os.path.dirname(pl), "backup")
-                os.makedirs(bak_dir, exist_ok=True)
-                shutil.copy2(pl, os.path.join(bak_dir,
-                                              os.path.basename(pl)))
-                try:
-                    with open(pl,"w",encoding="utf-8") as f: f.writelines(updated)
-                    changed_files += 1
-                except Exception:                             # noqa: BLE001
-                    messagebox.showwarning("Write failed",
-                                           f"Couldn’t update {pl}.")
-        return changed_files
+    def _apply_drive_changes(self, mapping: Dict[str,str]) -> int:
+        # one C-level regex pass per file: optional URI prefix at line
+        # start, then any mapped drive followed by a separator
+        # (discovered drives are uppercased, so match case-insensitively)
+        pattern = re.compile(r"^((?:file:[/\\]+)?)("
+                             + "|".join(re.escape(d) for d in mapping)
+                             + r")([\\/])", re.MULTILINE | re.IGNORECASE)
+        made_dirs: Set[str] = set()
+        with ThreadPoolExecutor(max_workers=_pool_size()) as pool:
+            return sum(pool.map(
+                lambda pl: self._rewrite_file(pl, mapping, pattern, made_dirs),
+                self._all_playlists))
 
 
 # ────────────────────── launcher ────────────────────────────────────